@@ -1,17 +1,37 @@
 import streamlit as st
 import json
+import hashlib
 import re
 import os
-import tempfile
-from collections import Counter
-from typing import List, Tuple, Dict, Any
+import sys
+import threading
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Tuple, Dict, Any, Optional, NamedTuple
 import traceback
 
+# Prefer orjson's C parser when available
+try:
+    import orjson
+    
+    def json_loads(data):
+        """Parse JSON with orjson, falling back to the stdlib for input it rejects (e.g. bare NaN)"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        # Re-parse outside the handler so stdlib errors are not chained to orjson's
+        return json.loads(data)
+except ImportError:
+    json_loads = json.loads
+
 # Configuration Constants
 MIN_TURN_METADATA = 8
 MIN_FAIL_PERCENTAGE = 50
 MIN_HUMAN_PASS_PERCENTAGE = 100
-RESTRICTED_INSTRUCTIONS = [
+RESTRICTED_INSTRUCTIONS = frozenset([
     "length_constraints:number_characters",
     "length_constraints:number_words",
     "length_constraints:sentence_length",
@@ -30,73 +50,196 @@ RESTRICTED_INSTRUCTIONS = [
     "punctuation:question_exclaim",
     "detectable_format:max_paragraph_length",
     "detectable_content:numeric_inclusion"
-]
+])
 CHECK_MISALIGNED_VALIDATION = True
+RESULT_CACHE_SIZE = 64
+
+# Canonical Tags (interned so tag comparisons short-circuit on identity)
+TAG_CACHE_SIZE = 4096
+TAG_CACHE = {t: sys.intern(t) for t in (
+    "[system]", "[user]", "[assistant_nemo]", "[assistant_qwen]",
+    "[turn_metadata]", "[conversation_end]"
+)}
+WORD_COUNT_TAGS = frozenset({"[system]", "[user]"})
+ASSISTANT_TURN_TAGS = frozenset({"[assistant_nemo]", "[assistant_qwen]"})
+
+# Report Tags: [assistant_(nemo|qwen)_#_(validation|human)_report]
+REPORT_PREFIXES = ("[assistant_nemo_", "[assistant_qwen_")
+REPORT_PREFIX_LEN = len("[assistant_nemo_")
+REPORT_SUFFIXES = (("_validation_report]", "validation"), ("_human_report]", "human"))
+
+# Precompiled Patterns
+JSON_FENCE_RE = re.compile(r"```+\s*json\s*", re.I)
+RANGE_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+
+# Result Types
+class TagIndex(NamedTuple):
+    """Tag positions collected by get_tags so validators need not rescan the tags"""
+    positions: Dict[str, List[int]]
+    conv_end: Optional[int]
+    json_cells: List[Tuple[int, str]]
+
+class TurnMetadataStats(NamedTuple):
+    """Instruction counts from a [turn_metadata] cell"""
+    instructions: int
+    llm_judge: int
+    total: int
+
+class ReportStats(NamedTuple):
+    """Pass/fail summary of a validation or human report"""
+    total_length: int
+    passed: int
+    failed: int
+    pass_percentage: float
+    fail_percentage: float
+    llm_passed: int
+    llm_failed: int
+
+class FileResult(NamedTuple):
+    """Validation outcome for one uploaded file"""
+    filename: str
+    is_valid: bool
+    errors: List[str]
 
 # Utility Functions
-def word_count(text: str) -> int:
-    """Count words in text"""
-    return len(text.split())
+def word_count(source) -> int:
+    """Count whitespace-separated words in cell source (list of lines or string)"""
+    if isinstance(source, str):
+        return len(source.split())
+    # Elements concatenate, so a word may span two of them unless each one ends a line
+    if all(line.endswith("\n") for line in source[:-1]):
+        return sum(len(line.split()) for line in source)
+    return len("".join(source).split())
+
+def canonical_tag(tag: str) -> str:
+    """Return the shared interned instance of a tag, caching up to TAG_CACHE_SIZE tags"""
+    cached = TAG_CACHE.get(tag)
+    if cached is None:
+        # Leave tags past the cap uninterned so odd inputs cannot grow the cache
+        if len(TAG_CACHE) >= TAG_CACHE_SIZE:
+            return tag
+        cached = TAG_CACHE[tag] = sys.intern(tag)
+    return cached
+
+def classify_tag(tag: str) -> Optional[str]:
+    """Classify JSON cells as "turn_metadata", "validation" or "human"; None for other tags"""
+    if tag == "[turn_metadata]":
+        return "turn_metadata"
+    if not tag.startswith(REPORT_PREFIXES):
+        return None
+    for suffix, kind in REPORT_SUFFIXES:
+        if tag.endswith(suffix):
+            # The model number between prefix and suffix must be all digits
+            return kind if tag[REPORT_PREFIX_LEN:-len(suffix)].isdecimal() else None
+    return None
+
+def get_source_lines(source) -> List[str]:
+    """Split cell source (list of lines or string) into lines"""
+    if isinstance(source, str):
+        return source.splitlines()
+    # A single-element list is just a string in a wrapper; skip the flattening pass
+    if len(source) == 1:
+        return source[0].splitlines()
+    # nbformat defines a list source as the concatenation of its elements, so splitting
+    # per element is only safe when every element but the last ends a line
+    if all(chunk.endswith("\n") for chunk in source[:-1]):
+        return [line for chunk in source for line in chunk.splitlines()]
+    return "".join(source).splitlines()
+
+def parse_range(text: str) -> Tuple[int, int]:
+    """Parse a "min-max" range from metadata text"""
+    if not text:
+        return None, None
+    m = RANGE_RE.match(text)
+    if m:
+        return int(m.group(1)), int(m.group(2))
+    return None, None
 
 def format_error(index: int, tag: str, error_type: str, details: str, preview: str = "") -> str:
     """Format error message"""
     return f"🔴 Cell {index} [{tag}] - {error_type}: {details}\n   Preview: {preview[:100]}..."
 
-def evaluate_results(results: List[Dict]) -> Dict:
-    """Evaluate validation results"""
-    status_counts = Counter(item["status"] for item in results)
-    llm_status_counts = Counter(item["status"] for item in results if "llm_judge_" in item["id"])
+def evaluate_results(results: List[Dict]) -> Tuple[ReportStats, Optional[List[str]]]:
+    """Evaluate validation results and collect llm_judge verdicts in a single pass"""
+    passed = failed = llm_passed = llm_failed = 0
+    # "<id>_Passed"/"<id>_Failed" per llm_judge item; None if any status is not text
+    llm_verdicts = []
+    
+    for item in results:
+        status = item["status"]
+        is_llm = "llm_judge_" in item["id"]
+        
+        if status == "Passed":
+            passed += 1
+            if is_llm:
+                llm_passed += 1
+        elif status == "Failed":
+            failed += 1
+            if is_llm:
+                llm_failed += 1
+        
+        if llm_verdicts is not None:
+            if not isinstance(status, str):
+                llm_verdicts = None
+            elif is_llm:
+                lowered = status.lower()
+                if lowered == "passed":
+                    llm_verdicts.append(f"{item['id']}_Passed")
+                elif lowered == "failed":
+                    llm_verdicts.append(f"{item['id']}_Failed")
     
     total = len(results)
-    passed = status_counts.get("Passed", 0)
-    failed = status_counts.get("Failed", 0)
-    
     pass_percentage = (passed / total) * 100 if total else 0
     fail_percentage = (failed / total) * 100 if total else 0
     
-    return {
-        "total_length": total,
-        "passed": passed,
-        "failed": failed,
-        "pass_percentage": round(pass_percentage, 2),
-        "fail_percentage": round(fail_percentage, 2),
-        "llm_passed": llm_status_counts.get("Passed", 0),
-        "llm_failed": llm_status_counts.get("Failed", 0),
-    }
+    return ReportStats(
+        total_length=total,
+        passed=passed,
+        failed=failed,
+        pass_percentage=round(pass_percentage, 2),
+        fail_percentage=round(fail_percentage, 2),
+        llm_passed=llm_passed,
+        llm_failed=llm_failed,
+    ), llm_verdicts
 
-def extract_json_from_body(body: str) -> Tuple[str, str]:
-    """Extract JSON from markdown code block"""
-    lines = body.splitlines()
-    i = 0
-    while i < len(lines) and not lines[i].strip():
-        i += 1
-    if i == len(lines):
+def extract_json_from_lines(lines: List[str]) -> Tuple[str, str]:
+    """Extract JSON from markdown code block in pre-split cell lines"""
+    # Skip leading blank lines, keeping the stripped opener for the fence check
+    for i, line in enumerate(lines):
+        first = line.strip()
+        if first:
+            break
+    else:
         return None, "Cell is empty. Expected a ```json block."
     
-    first = lines[i].strip()
-    if not re.fullmatch(r"```+\s*json\s*", first, re.I):
+    if not JSON_FENCE_RE.fullmatch(first):
         return None, "Content must start explicitly with ```json"
     
-    j = i + 1
-    while j < len(lines) and not lines[j].strip().startswith("```"):
-        j += 1
-    
-    if j == len(lines):
-        return None, "Missing closing ``` for the JSON block."
+    for j in range(i + 1, len(lines)):
+        if lines[j].lstrip().startswith("```"):
+            return "\n".join(lines[i+1:j]), None
     
-    return "\n".join(lines[i+1:j]), None
+    return None, "Missing closing ``` for the JSON block."
 
-def get_tags(filepath: str) -> Tuple[List, List, List, List, List, Dict]:
-    """Extract tags and metadata from notebook"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        nb = json.load(f)
+def get_tags(filepath: str) -> Tuple[List, List, List, List, List, List, Dict, TagIndex]:
+    """Extract tags and metadata from notebook file"""
+    with open(filepath, 'rb') as f:
+        return get_tags_from_bytes(f.read())
+
+def get_tags_from_bytes(data: bytes) -> Tuple[List, List, List, List, List, List, Dict, TagIndex]:
+    """Extract tags and metadata from raw notebook content"""
+    # Both parsers accept raw UTF-8 bytes, so no decode to str is needed first
+    nb = json_loads(data)
     
     tags = []
     bodies = []
+    word_counts = []
     previews = []
     indices = []
     cell_errors = []
     meta = {}
+    tag_positions = defaultdict(list)
+    json_cells = []
     
     # Extract metadata
     if "metadata" in nb and "length_constraints" in nb["metadata"]:
@@ -105,60 +248,74 @@ def get_tags(filepath: str) -> Tuple[List, List, List, List, List, Dict]:
     cells = nb.get("cells", [])
     
     for idx, cell in enumerate(cells):
+        # Outputs are never validated; release them before allocating this cell's lines
+        cell.pop("outputs", None)
         cell_tags = cell.get("metadata", {}).get("tags", [])
-        source = "".join(cell.get("source", []))
         
+        # Untagged cells are never validated, so skip them before touching the source
         if not cell_tags:
             continue
         
-        tag = cell_tags[0]
+        # Validators compare tags against string literals, which CPython interns; routing every
+        # tag through canonical_tag keeps those == checks on the identity fast path
+        tag = canonical_tag(cell_tags[0])
+        tag_positions[tag].append(len(tags))
         tags.append(tag)
-        bodies.append(source)
         indices.append(idx)
         
-        # Create preview
-        first_line = source.split("\n")[0] if source else ""
-        previews.append(first_line[:50])
-    
-    return tags, cell_errors, previews, bodies, indices, meta
+        # Only JSON cells need their body; prompt cells only need a word count
+        raw_source = cell.get("source", [])
+        kind = classify_tag(tag)
+        if kind:
+            json_cells.append((len(tags) - 1, kind))
+            source = get_source_lines(raw_source)
+            bodies.append(source)
+            previews.append(source[0][:50] if source else "")
+        else:
+            bodies.append(None)
+            previews.append("")
+        word_counts.append(word_count(raw_source) if tag in WORD_COUNT_TAGS else 0)
+    
+    conv_end = tag_positions["[conversation_end]"][0] if "[conversation_end]" in tag_positions else None
+    tag_index = TagIndex(dict(tag_positions), conv_end, json_cells)
+    
+    return tags, cell_errors, previews, bodies, word_counts, indices, meta, tag_index
 
-def validate_structure(tags: List[str], previews: List[str], indices: List[int]) -> List[str]:
+def validate_structure(tags: List[str], previews: List[str], indices: List[int], tag_index: TagIndex) -> List[str]:
     """Validate notebook structure"""
     errs = []
     
     # Check for required tags
-    if "[system]" not in tags:
+    if "[system]" not in tag_index.positions:
         errs.append("❌ Missing required [system] tag")
-    if "[turn_metadata]" not in tags:
+    if "[turn_metadata]" not in tag_index.positions:
         errs.append("❌ Missing required [turn_metadata] tag")
     
     # Find conversation end
-    try:
-        conv_end = tags.index("[conversation_end]")
-    except ValueError:
+    conv_end = tag_index.conv_end
+    if conv_end is None:
         errs.append("❌ Missing [conversation_end] tag")
         return errs
     
-    # Validate conversation structure
-    conv_tags = tags[:conv_end]
-    
-    # Check alternating pattern
-    user_assistant_tags = [t for t in conv_tags if t in ["[user]", "[assistant_nemo]", "[assistant_qwen]"]]
-    
-    if not user_assistant_tags:
+    # Check alternating pattern in a single scan, tracking the previous turn kind
+    prev_turn = None
+    for t in islice(tags, conv_end):
+        if t == "[user]":
+            if prev_turn == "[user]":
+                errs.append(f"❌ Consecutive [user] tags found - pattern broken")
+            prev_turn = t
+        elif t in ASSISTANT_TURN_TAGS:
+            if prev_turn == "[assistant]":
+                errs.append(f"❌ Consecutive assistant tags found - pattern broken")
+            prev_turn = "[assistant]"
+    
+    if prev_turn is None:
         errs.append("❌ No conversation turns found")
         return errs
     
-    for i in range(len(user_assistant_tags) - 1):
-        if user_assistant_tags[i] == "[user]" and user_assistant_tags[i+1] == "[user]":
-            errs.append(f"❌ Consecutive [user] tags found - pattern broken")
-        elif user_assistant_tags[i] in ["[assistant_nemo]", "[assistant_qwen]"] and \
-             user_assistant_tags[i+1] in ["[assistant_nemo]", "[assistant_qwen]"]:
-            errs.append(f"❌ Consecutive assistant tags found - pattern broken")
-    
     return errs
 
-def validate_lengths(tags: List[str], bodies: List[str], meta: Dict) -> List[str]:
+def validate_lengths(tag_index: TagIndex, word_counts: List[int], meta: Dict) -> List[str]:
     """Validate length constraints"""
     errs = []
     
@@ -168,196 +325,209 @@ def validate_lengths(tags: List[str], bodies: List[str], meta: Dict) -> List[str
     u_text = meta.get("user_prompt_words", "")
     
     # Parse ranges
-    def parse_range(text):
-        if not text:
-            return None, None
-        m = re.match(r"(\d+)\s*-\s*(\d+)", text)
-        if m:
-            return int(m.group(1)), int(m.group(2))
-        return None, None
-    
     min_c, max_c = parse_range(c_text)
     min_s, max_s = parse_range(s_text)
     min_u, max_u = parse_range(u_text)
     
+    if min_c is None and min_s is None and min_u is None:
+        return errs
+    
     # Find conversation end
-    try:
-        conv_end = tags.index("[conversation_end]")
-    except ValueError:
+    conv_end = tag_index.conv_end
+    if conv_end is None:
         return errs
     
+    # Positions are sorted, so the conversation cells are a prefix of each list
+    user_positions = tag_index.positions.get("[user]", [])
+    turns = bisect_left(user_positions, conv_end)
+    
     # Check turn count
-    if min_c is not None:
-        conv_tags = tags[:conv_end]
-        turns = sum(1 for t in conv_tags if t == "[user]")
-        if not (min_c <= turns <= max_c):
-            errs.append(f"📏 Length Error: Conversation turns ({turns}) outside range ({c_text})")
+    if min_c is not None and not (min_c <= turns <= max_c):
+        errs.append(f"📏 Length Error: Conversation turns ({turns}) outside range ({c_text})")
     
     # Check system prompt
     if min_s is not None:
-        sys_words = sum(word_count(bodies[i]) for i, t in enumerate(tags[:conv_end]) if t == "[system]")
-        if sys_words > 0:
-            if not (min_s <= sys_words <= max_s):
-                errs.append(f"📏 Length Error: System prompt words ({sys_words}) outside range ({s_text})")
+        system_positions = tag_index.positions.get("[system]", [])
+        system_count = bisect_left(system_positions, conv_end)
+        sys_words = sum(word_counts[i] for i in islice(system_positions, system_count))
+        if sys_words > 0 and not (min_s <= sys_words <= max_s):
+            errs.append(f"📏 Length Error: System prompt words ({sys_words}) outside range ({s_text})")
     
     # Check user prompts
     if min_u is not None:
-        for i, t in enumerate(tags[:conv_end]):
-            if t == "[user]":
-                user_count = word_count(bodies[i])
-                if user_count:
-                    if not (min_u <= user_count <= max_u):
-                        errs.append(f"📏 Length Error: User prompt words ({user_count}) outside range ({u_text})")
+        for i in islice(user_positions, turns):
+            user_count = word_counts[i]
+            if user_count and not (min_u <= user_count <= max_u):
+                errs.append(f"📏 Length Error: User prompt words ({user_count}) outside range ({u_text})")
     
     return errs
 
-def validate_json_cells(tags: List[str], bodies: List[str], previews: List[str], indices: List[int]) -> List[str]:
-    """Validate JSON formatting in cells"""
-    errs = []
-    
-    for i, t in enumerate(tags):
-        if t == "[turn_metadata]" or \
-           re.fullmatch(r"\[assistant_(nemo|qwen)_\d+_validation_report\]", t) or \
-           re.fullmatch(r"\[assistant_(nemo|qwen)_\d+_human_report\]", t):
-            
-            js, err = extract_json_from_body(bodies[i])
-            if err:
-                errs.append(format_error(indices[i], t, "JSON Format Error", err, previews[i]))
-                continue
-            
-            try:
-                json.loads(js)
-            except Exception as e:
-                errs.append(format_error(indices[i], t, "JSON Syntax Error", str(e), previews[i]))
-    
-    return errs
-
-def validate_report_len_cells(tags: List[str], bodies: List[str], previews: List[str], indices: List[int]) -> List[str]:
-    """Validate report cells and metadata"""
+def validate_reports(tags: List[str], bodies: List[Optional[List[str]]], previews: List[str], indices: List[int], tag_index: TagIndex) -> List[str]:
+    """Validate JSON formatting, turn metadata and report cells in a single pass"""
     errs = []
     basic_validation = {}
     llm_results = None
     hllm_results = None
     
-    for i, t in enumerate(tags):
-        if t == "[turn_metadata]" or \
-           re.fullmatch(r"\[assistant_(nemo|qwen)_\d+_validation_report\]", t) or \
-           re.fullmatch(r"\[assistant_(nemo|qwen)_\d+_human_report\]", t):
-            
-            js, err = extract_json_from_body(bodies[i])
-            if err:
-                errs.append(format_error(indices[i], t, "JSON Format Error", err, previews[i]))
-                continue
+    for i, kind in tag_index.json_cells:
+        t = tags[i]
+        
+        js, err = extract_json_from_lines(bodies[i])
+        if err:
+            errs.append(format_error(indices[i], t, "JSON Format Error", err, previews[i]))
+            continue
+        
+        try:
+            parsed_json = json_loads(js)
+        except Exception as e:
+            errs.append(format_error(indices[i], t, "JSON Syntax Error", str(e), previews[i]))
+            continue
+        
+        try:
+            if kind == "turn_metadata":
+                instructionset = parsed_json.get("instructions", [])
+                instruction_count = len(instructionset)
+                llm_judge_count = len(parsed_json.get("llm_judge", []))
+                stats = TurnMetadataStats(instruction_count, llm_judge_count, instruction_count + llm_judge_count)
+                basic_validation[t] = stats
+                
+                if stats.total < MIN_TURN_METADATA:
+                    errs.append(format_error(
+                        indices[i], t, f"Minimum {MIN_TURN_METADATA} turn_metadata",
+                        "length validation", previews[i]
+                    ))
+                
+                if instructionset:
+                    # Set membership hashes the id, so non-string ids (lists, dicts) are skipped
+                    word_checks = [instr for instr in instructionset 
+                                 if isinstance(instr.get("instruction_id"), str)
+                                 and instr["instruction_id"] in RESTRICTED_INSTRUCTIONS]
+                    if word_checks:
+                        errs.append(format_error(
+                            indices[i], t, "Restricted Instructions in turn_metadata",
+                            str(word_checks), previews[i]
+                        ))
             
-            try:
-                parsed_json = json.loads(js)
+            else:
+                results = parsed_json.get("results") if isinstance(parsed_json, dict) else parsed_json
+                report, llm_verdicts = evaluate_results(results)
+                basic_validation[t] = report
+                
+                turn_metadata_report = basic_validation.get("[turn_metadata]")
                 
-                if t == "[turn_metadata]":
-                    basic_validation[t] = {
-                        "instructions": len(parsed_json.get("instructions", [])),
-                        "llm_judge": len(parsed_json.get("llm_judge", []))
-                    }
-                    basic_validation[t]["total"] = basic_validation[t]["instructions"] + basic_validation[t]["llm_judge"]
+                if kind == "validation":
+                    if turn_metadata_report is None:
+                        errs.append(f"🔴 {t} - VALIDATION REPORT ERROR: No parsed [turn_metadata] found before this report")
+                        continue
                     
-                    instructionset = parsed_json.get("instructions", [])
-                    if (len(instructionset) + len(parsed_json.get("llm_judge", []))) < MIN_TURN_METADATA:
+                    if report.total_length != turn_metadata_report.total:
                         errs.append(format_error(
-                            indices[i], t, f"Minimum {MIN_TURN_METADATA} turn_metadata",
-                            "length validation", previews[i]
+                            indices[i], t, "Turn_MetaData Validation Report coverage Error",
+                            f"TMD:{turn_metadata_report.total} is not {t}:{report.total_length}", 
+                            str(report._asdict())
                         ))
                     
-                    if instructionset:
-                        word_checks = [instr for instr in instructionset 
-                                     if instr.get("instruction_id") in RESTRICTED_INSTRUCTIONS]
-                        if word_checks:
-                            errs.append(format_error(
-                                indices[i], t, "Restricted Instructions in turn_metadata",
-                                str(word_checks), previews[i]
-                            ))
+                    if llm_verdicts is None:
+                        errs.append(f"🔴 {t} - VALIDATION REPORT ERROR: ID field not found in JSON for llm_judge")
+                        continue
+                    llm_results = llm_verdicts
                 
-                else:
-                    results = parsed_json.get("results") if isinstance(parsed_json, dict) else parsed_json
-                    report = evaluate_results(results)
-                    basic_validation[t] = report
-                    
-                    turn_metadata_report = basic_validation.get("[turn_metadata]")
+                if kind == "human":
+                    if llm_verdicts is None:
+                        errs.append(f"🔴 {t} - HUMAN REPORT ERROR: ID field not found in JSON for llm_judge")
+                        continue
+                    hllm_results = llm_verdicts
                     
-                    if re.fullmatch(r"\[assistant_(nemo|qwen)_\d+_validation_report\]", t):
-                        if report.get("total_length") != turn_metadata_report.get("total"):
-                            errs.append(format_error(
-                                indices[i], t, "Turn_MetaData Validation Report coverage Error",
-                                f"TMD:{turn_metadata_report.get('total')} is not {t}:{report.get('total_length')}", 
-                                str(report)
-                            ))
-                        
-                        try:
-                            passed = [x for x in results if x["status"].lower() == "passed"]
-                            failed = [x for x in results if x["status"].lower() == "failed"]
-                            llm_results = [f"{_.get('id')}_Passed" for _ in passed if "llm_judge_" in _.get("id")] + \
-                                        [f"{_.get('id')}_Failed" for _ in failed if "llm_judge_" in _.get("id")]
-                        except Exception as e:
-                            errs.append(f"🔴 {t} - VALIDATION REPORT ERROR: ID field not found in JSON for llm_judge")
-                            continue
+                    if report.total_length != basic_validation["[turn_metadata]"].llm_judge:
+                        errs.append(f"🔴 {t} - Turn_MetaData Human Report Coverage Error")
+                
+                if llm_results is not None and hllm_results is not None:
+                    llmr = set(llm_results)
                     
-                    if re.fullmatch(r"\[assistant_(nemo|qwen)_\d+_human_report\]", t):
-                        passed = [x for x in results if x["status"].lower() == "passed"]
-                        failed = [x for x in results if x["status"].lower() == "failed"]
-                        
-                        try:
-                            hllm_results = [f"{_.get('id')}_Passed" for _ in passed if "llm_judge_" in _.get("id")] + \
-                                         [f"{_.get('id')}_Failed" for _ in failed if "llm_judge_" in _.get("id")]
-                        except Exception as e:
-                            errs.append(f"🔴 {t} - HUMAN REPORT ERROR: ID field not found in JSON for llm_judge")
-                            continue
-                        
-                        report = evaluate_results(results)
-                        basic_validation[t] = report
-                        
-                        if report["total_length"] != basic_validation["[turn_metadata]"]["llm_judge"]:
-                            errs.append(f"🔴 {t} - Turn_MetaData Human Report Coverage Error")
+                    # Every llm_judge verdict must be matched by the human report (duplicate ids never pass)
+                    human_validation_passed = len(llmr) == len(llm_results) and llmr <= set(hllm_results)
                     
-                    if llm_results is not None and hllm_results is not None:
-                        llmr = set(sorted(llm_results))
-                        hllmr = set(sorted(hllm_results))
+                    if not human_validation_passed:
+                        validation_results = basic_validation[t.replace("human", "validation")]
+                        human_results = basic_validation[t]
                         
-                        intersection = llmr & hllmr
-                        human_validation_passed = len(intersection) == len(llm_results)
+                        diff_llm_failed = validation_results.failed + (human_results.llm_failed - validation_results.llm_failed)
+                        total_failed_percentage = (diff_llm_failed / validation_results.total_length) * 100
                         
-                        if not human_validation_passed:
-                            validation_results = basic_validation[t.replace("human", "validation")]
-                            human_results = basic_validation[t]
-                            
-                            diff_llm_failed = validation_results["failed"] + (human_results["llm_failed"] - validation_results["llm_failed"])
-                            total_failed_percentage = (diff_llm_failed / validation_results["total_length"]) * 100
-                            
-                            if int(total_failed_percentage) < int(MIN_FAIL_PERCENTAGE):
-                                errs.append(f"🔴 {t} - HUMAN VALIDATION ERROR: Total failed percentage ({total_failed_percentage:.2f}%) is less than minimum ({MIN_FAIL_PERCENTAGE}%)")
-            
-            except Exception as e:
-                errs.append(f"🔴 {t} - Error processing: {str(e)}")
-    
+                        if int(total_failed_percentage) < int(MIN_FAIL_PERCENTAGE):
+                            errs.append(f"🔴 {t} - HUMAN VALIDATION ERROR: Total failed percentage ({total_failed_percentage:.2f}%) is less than minimum ({MIN_FAIL_PERCENTAGE}%)")
+        
+        except Exception as e:
+            errs.append(f"🔴 {t} - Error processing: {str(e)}")
+
     return errs
 
-def validate(tags: List[str], previews: List[str], bodies: List[str], indices: List[int], meta: Dict) -> List[str]:
+def validate(tags: List[str], previews: List[str], bodies: List[Optional[List[str]]], word_counts: List[int], indices: List[int], meta: Dict, tag_index: TagIndex) -> List[str]:
     """Main validation function"""
     errs = []
-    errs.extend(validate_structure(tags, previews, indices))
-    errs.extend(validate_lengths(tags, bodies, meta))
-    errs.extend(validate_json_cells(tags, bodies, previews, indices))
-    errs.extend(validate_report_len_cells(tags, bodies, previews, indices))
+    errs.extend(validate_structure(tags, previews, indices, tag_index))
+    errs.extend(validate_lengths(tag_index, word_counts, meta))
+    errs.extend(validate_reports(tags, bodies, previews, indices, tag_index))
     return errs
 
 def validate_notebook(filepath: str) -> Tuple[bool, List[str]]:
     """Validate a single notebook file"""
     try:
-        tags, cell_errors, previews, bodies, indices, meta = get_tags(filepath)
-        all_errs = cell_errors + validate(tags, previews, bodies, indices, meta)
+        with open(filepath, 'rb') as f:
+            file_bytes = f.read()
+    except Exception as e:
+        return False, [f"🔥 Unexpected error: {str(e)}\n{traceback.format_exc()}"]
+    return validate_notebook_bytes(file_bytes)
+
+def validate_notebook_bytes(file_bytes: bytes) -> Tuple[bool, List[str]]:
+    """Validate notebook content passed as raw bytes, e.g. an in-memory upload"""
+    try:
+        tags, cell_errors, previews, bodies, word_counts, indices, meta, tag_index = get_tags_from_bytes(file_bytes)
+        all_errs = cell_errors + validate(tags, previews, bodies, word_counts, indices, meta, tag_index)
         
         is_valid = len(all_errs) == 0
         return is_valid, all_errs
     except Exception as e:
         return False, [f"🔥 Unexpected error: {str(e)}\n{traceback.format_exc()}"]
 
+@st.cache_resource
+def get_result_cache() -> Tuple["OrderedDict[bytes, Tuple[bool, List[str]]]", threading.Lock]:
+    """Validation results keyed by content hash, shared across reruns and sessions, with the lock guarding them"""
+    return OrderedDict(), threading.Lock()
+
+def validate_uploaded_notebooks(contents: List[bytes]) -> List[Tuple[bool, List[str]]]:
+    """Validate uploaded notebooks, reusing cached results and spreading the rest across worker processes"""
+    cache, lock = get_result_cache()
+    digests = [hashlib.blake2b(content, digest_size=16).digest() for content in contents]
+    
+    # Only notebooks not seen before are validated; the cache is shared by every session thread
+    results = {}
+    pending = {}
+    with lock:
+        for digest, content in zip(digests, contents):
+            if digest in cache:
+                results[digest] = cache[digest]
+                cache.move_to_end(digest)
+            else:
+                pending[digest] = content
+    
+    if pending:
+        # Process startup outweighs the work for a single notebook
+        if len(pending) < 2:
+            outcomes = [validate_notebook_bytes(content) for content in pending.values()]
+        else:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(validate_notebook_bytes, pending.values()))
+        
+        with lock:
+            for digest, outcome in zip(pending, outcomes):
+                results[digest] = cache[digest] = outcome
+            while len(cache) > RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    return [results[digest] for digest in digests]
+
 # Streamlit App
 def main():
     st.set_page_config(
@@ -411,30 +581,17 @@ def main():
         results = []
         
         # Process each file
-        for uploaded_file in uploaded_files:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".ipynb") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
+        outcomes = validate_uploaded_notebooks([f.getvalue() for f in uploaded_files])
+        for uploaded_file, (is_valid, errors) in zip(uploaded_files, outcomes):
             
-            try:
-                is_valid, errors = validate_notebook(tmp_path)
-                
-                if is_valid:
-                    valid_count += 1
-                elif errors and any("Unexpected error" in err for err in errors):
-                    error_count += 1
-                else:
-                    invalid_count += 1
-                
-                results.append({
-                    "filename": uploaded_file.name,
-                    "is_valid": is_valid,
-                    "errors": errors
-                })
-            finally:
-                # Cleanup temp file
-                os.unlink(tmp_path)
+            if is_valid:
+                valid_count += 1
+            elif errors and any("Unexpected error" in err for err in errors):
+                error_count += 1
+            else:
+                invalid_count += 1
+            
+            results.append(FileResult(uploaded_file.name, is_valid, errors))
         
         # Display summary
         col1.metric("✅ Valid", valid_count)
@@ -444,11 +601,7 @@ def main():
         st.markdown("---")
         
         # Display detailed results
-        for result in results:
-            filename = result["filename"]
-            is_valid = result["is_valid"]
-            errors = result["errors"]
-            
+        for filename, is_valid, errors in results:
             if is_valid:
                 st.success(f"✅ **{filename}** - VALID")
             else:
@@ -457,37 +610,39 @@ def main():
                 else:
                     st.error(f"❌ **{filename}** - INVALID")
                 
-                # Display errors in expander
+                # Display errors in expander, as a single block per file
                 with st.expander(f"View errors for {filename}", expanded=False):
-                    for error in errors:
-                        st.code(error, language=None)
+                    st.code("\n\n".join(errors), language=None)
         
         # Download results option
         st.markdown("---")
         st.subheader("📥 Download Results")
         
-        # Create results text
-        results_text = "JUPYTER NOTEBOOK VALIDATION RESULTS\n"
-        results_text += "=" * 80 + "\n\n"
-        results_text += f"Total Files: {len(uploaded_files)}\n"
-        results_text += f"Valid: {valid_count}\n"
-        results_text += f"Invalid: {invalid_count}\n"
-        results_text += f"Errors: {error_count}\n\n"
-        results_text += "=" * 80 + "\n\n"
+        # Create results text (one entry per line, joined once)
+        report_lines = [
+            "JUPYTER NOTEBOOK VALIDATION RESULTS",
+            "=" * 80,
+            "",
+            f"Total Files: {len(uploaded_files)}",
+            f"Valid: {valid_count}",
+            f"Invalid: {invalid_count}",
+            f"Errors: {error_count}",
+            "",
+            "=" * 80,
+            "",
+        ]
         
-        for result in results:
-            filename = result["filename"]
-            is_valid = result["is_valid"]
-            errors = result["errors"]
-            
+        for filename, is_valid, errors in results:
             if is_valid:
-                results_text += f"✅ VALID: {filename}\n\n"
+                report_lines.append(f"✅ VALID: {filename}")
             else:
-                results_text += f"❌ INVALID: {filename}\n"
-                for error in errors:
-                    results_text += f"   {error}\n"
-                results_text += "\n"
-            results_text += "-" * 80 + "\n\n"
+                report_lines.append(f"❌ INVALID: {filename}")
+                report_lines.extend(f"   {error}" for error in errors)
+            report_lines.append("")
+            report_lines.append("-" * 80)
+            report_lines.append("")
+        
+        results_text = "\n".join(report_lines) + "\n"
         
         st.download_button(
             label="Download Validation Report",